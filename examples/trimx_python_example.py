@@ -12,14 +12,135 @@ import json
 import subprocess
 import tempfile
 import shutil
+import atexit
+import functools
+import hashlib
+import socket
+import time
+import threading
+import asyncio
+import queue
+import selectors
+import bisect
+from collections import OrderedDict, deque
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import List, Dict, Tuple, Optional, Union, Sequence
+from dataclasses import dataclass, field
 import argparse
+import logging
+import logging.handlers
 
-@dataclass
+logger = logging.getLogger("trimx")
+
+def _flush_logs():
+    """Write out buffered log records for the trimx logger and its ancestors
+    
+    Called before starting a child that writes straight to our stdout, so
+    its output cannot overtake log lines that are still buffered.
+    """
+    current = logger
+    while current is not None:
+        for handler in current.handlers:
+            handler.flush()
+        current = current.parent if current.propagate else None
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows; sample creation is then unlocked
+    fcntl = None
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; fall back to the bisect module
+    np = None
+
+try:
+    import numba
+except ImportError:  # Numba is optional; nearest-keyframe lookups stay in NumPy
+    numba = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # msgpack is optional; inspect output stays JSON
+    msgpack = None
+
+def parse_json(payload: bytes):
+    """Parse trimx JSON output directly from bytes"""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+# Stream type codes used by trimx inspect --format msgpack
+MSGPACK_STREAM_TYPES = {0: "video", 1: "audio", 2: "subtitle"}
+
+def parse_msgpack_inspect(payload: bytes) -> Dict:
+    """Decode trimx inspect msgpack output into the same shape as its JSON
+    
+    The binary schema encodes stream types as small integers and keyframes
+    as bare timestamps.
+    """
+    data = msgpack.unpackb(payload, raw=False)
+    for stream in data.get("streams", []):
+        stream["type"] = MSGPACK_STREAM_TYPES.get(stream.get("type"), "unknown")
+    data["keyframes"] = [
+        kf if isinstance(kf, dict) else {"timestamp": kf}
+        for kf in data.get("keyframes", [])
+    ]
+    return data
+
+# Capability name -> (subcommand whose --help lists it, marker in that help).
+# clap's top-level help only shows subcommands and global flags, so options
+# of a subcommand have to be looked up in that subcommand's own help.
+TRIMX_CAPABILITY_MARKERS = {
+    "daemon": (None, "daemon"),
+    "command-stream": (None, "--command-stream"),
+    "verify": ("clip", "--verify"),
+    "msgpack": ("inspect", "msgpack"),
+}
+
+def _resolve_executable(path: str) -> str:
+    """Resolve a trimx path against PATH, leaving unknown paths unchanged"""
+    return shutil.which(path) or path
+
+@functools.lru_cache(maxsize=None)
+def _trimx_help(path: str, subcommand: Optional[str] = None) -> str:
+    """Run trimx [subcommand] --help once per executable and subcommand
+    
+    Raises OSError if trimx cannot be run. The exception is not cached, so
+    a failed probe is retried on the next call.
+    """
+    cmd = [path] + ([subcommand] if subcommand else []) + ["--help"]
+    return subprocess.run(cmd, capture_output=True, text=True, close_fds=False).stdout
+
+def _trimx_has_capability(path: str, name: str) -> bool:
+    """Whether the trimx executable at path advertises a TRIMX_CAPABILITY_MARKERS feature"""
+    subcommand, marker = TRIMX_CAPABILITY_MARKERS[name]
+    try:
+        return marker in _trimx_help(path, subcommand)
+    except OSError:
+        return False
+
+def _clear_dir(path: str):
+    """Delete every file under path but keep the directories for reuse"""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _clear_dir(entry.path)
+            else:
+                os.unlink(entry.path)
+
+@dataclass(slots=True, frozen=True)
 class VideoInfo:
-    """Video information container"""
+    """Video information container
+    
+    Hashing uses the scalar fields only, so instances can serve as cache keys.
+    """
     path: str
     duration: float
     width: int
@@ -27,10 +148,85 @@ class VideoInfo:
     frame_rate: float
     bit_rate: int
     file_size: int
-    video_streams: List[Dict]
-    audio_streams: List[Dict]
+    video_streams: List[Dict] = field(hash=False)
+    audio_streams: List[Dict] = field(hash=False)
+    keyframes: List[Dict] = field(default_factory=list, hash=False)
+    # Sorted timestamps derived from keyframes when not given; may be a NumPy
+    # array, which does not support ==
+    keyframe_times: Sequence[float] = field(default=(), compare=False)
+    
+    def __post_init__(self):
+        if not len(self.keyframe_times) and self.keyframes:
+            object.__setattr__(self, "keyframe_times", sorted_keyframe_times(self.keyframes))
+
+def sorted_keyframe_times(keyframes: List[Dict]) -> Sequence[float]:
+    """Extract keyframe timestamps into a sorted array for binary search"""
+    if np is not None:
+        times = np.fromiter((k["timestamp"] for k in keyframes), dtype=np.float64,
+                            count=len(keyframes))
+        times.sort()
+        return times
+    return sorted(k["timestamp"] for k in keyframes)
+
+if numba is not None and np is not None:
+    @numba.njit(cache=True)
+    def _nearest_kf(times, target):
+        # Binary search compiled to machine code, avoiding the per-call
+        # overhead of searchsorted + slicing + argmin for a single target
+        lo, hi = 0, len(times)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if times[mid] < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        best = times[min(lo, len(times) - 1)]
+        if lo > 0 and abs(times[lo - 1] - target) <= abs(best - target):
+            best = times[lo - 1]
+        return best
+else:
+    _nearest_kf = None
+
+def nearest_keyframe_time(times: Sequence[float], target: float) -> float:
+    """Return the keyframe timestamp closest to target (times must be sorted and non-empty)"""
+    if _nearest_kf is not None:
+        return float(_nearest_kf(times, float(target)))
+    if np is not None:
+        idx = int(np.searchsorted(times, target))
+        candidates = times[max(0, idx - 1):idx + 1]
+        return float(candidates[np.argmin(np.abs(candidates - target))])
+    
+    idx = bisect.bisect_left(times, target)
+    candidates = times[max(0, idx - 1):idx + 1]
+    return min(candidates, key=lambda t: abs(t - target))
+
+def snap_to_keyframes(times: Sequence[float], desired: Sequence[float], 
+                      tolerance: float) -> Sequence[float]:
+    """Move each desired time to its nearest keyframe if within tolerance
+    
+    times must be sorted. With NumPy all lookups run as one vectorized
+    searchsorted call, so S targets cost O(S log N) against N keyframes.
+    """
+    if np is not None:
+        times = np.asarray(times, dtype=np.float64)
+        desired = np.asarray(desired, dtype=np.float64)
+        if not len(times):
+            return desired.copy()
+        idx = np.searchsorted(times, desired)
+        left = times[np.clip(idx - 1, 0, None)]
+        right = times[np.clip(idx, 0, len(times) - 1)]
+        nearest = np.where(np.abs(left - desired) <= np.abs(right - desired), left, right)
+        return np.where(np.abs(nearest - desired) <= tolerance, nearest, desired)
+    
+    if not len(times):
+        return list(desired)
+    snapped = []
+    for target in desired:
+        nearest = nearest_keyframe_time(times, target)
+        snapped.append(nearest if abs(nearest - target) <= tolerance else target)
+    return snapped
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ClipSegment:
     """Video clip segment definition"""
     start_time: float
@@ -38,64 +234,687 @@ class ClipSegment:
     name: str
     description: Optional[str] = None
 
+@dataclass(slots=True)
+class ClipSegmentBatch:
+    """Clip segments stored as parallel arrays
+    
+    Keeps start and end times in contiguous float arrays (NumPy when
+    available) so operations over every segment can run as a single
+    vectorized call instead of a per-segment Python loop.
+    """
+    starts: Sequence[float]
+    ends: Sequence[float]
+    names: List[str]
+    descriptions: List[Optional[str]]
+    
+    @classmethod
+    def from_segments(cls, segments: List[ClipSegment]) -> "ClipSegmentBatch":
+        if np is not None:
+            starts = np.fromiter((s.start_time for s in segments), dtype=np.float64,
+                                 count=len(segments))
+            ends = np.fromiter((s.end_time for s in segments), dtype=np.float64,
+                               count=len(segments))
+        else:
+            starts = [s.start_time for s in segments]
+            ends = [s.end_time for s in segments]
+        return cls(starts, ends, [s.name for s in segments],
+                   [s.description for s in segments])
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    def snapped_to_keyframes(self, times: Sequence[float], 
+                             tolerance: float) -> "ClipSegmentBatch":
+        """Return a copy with cut points moved to nearby keyframes
+        
+        Segments that would collapse (end at or before start) keep their
+        original times.
+        """
+        starts = snap_to_keyframes(times, self.starts, tolerance)
+        ends = snap_to_keyframes(times, self.ends, tolerance)
+        
+        if np is not None:
+            valid = ends > starts
+            starts = np.where(valid, starts, self.starts)
+            ends = np.where(valid, ends, self.ends)
+        else:
+            pairs = [
+                (start, end) if end > start else (orig_start, orig_end)
+                for start, end, orig_start, orig_end in zip(starts, ends, self.starts, self.ends)
+            ]
+            starts = [start for start, _ in pairs]
+            ends = [end for _, end in pairs]
+        
+        return ClipSegmentBatch(starts, ends, list(self.names), list(self.descriptions))
+    
+    def to_segments(self) -> List[ClipSegment]:
+        return [
+            ClipSegment(float(start), float(end), name, description)
+            for start, end, name, description in zip(
+                self.starts, self.ends, self.names, self.descriptions
+            )
+        ]
+
 class TrimXProcessor:
     """TrimX CLI processor with Python integration"""
     
-    def __init__(self, trimx_path: str = "trimx"):
+    # Cap on concurrent re-encodes; each encoder already uses several threads
+    REENCODE_MAX_WORKERS = 2
+    # Number of inspected files kept in the metadata cache
+    INSPECT_CACHE_SIZE = 32
+    # Seconds to wait for the trimx daemon socket to accept connections
+    DAEMON_STARTUP_TIMEOUT = 2.0
+    # Seconds to wait for a daemon reply before dropping the connection
+    DAEMON_REQUEST_TIMEOUT = 300.0
+    # Seconds to wait for a stream worker reply before killing the worker
+    WORKER_REQUEST_TIMEOUT = 300.0
+    # Popen options that let CPython start trimx with posix_spawn instead of
+    # fork+exec, which avoids copying the page tables of a large parent.
+    # Python file descriptors are non-inheritable by default, so not closing
+    # them in the child is safe.
+    SPAWN_OPTIONS = {"close_fds": False}
+    _fork_warning_shown = False
+    _ffprobe_warning_shown = False
+    # Work dirs recycled between contexts created with reuse_temp=True
+    _shared_temp_root: Optional[str] = None
+    _free_temp_dirs: List[str] = []
+    _temp_lock = threading.Lock()
+    
+    def __init__(self, trimx_path: str = "trimx", max_workers: Optional[int] = None,
+                 use_daemon: bool = False, stream_workers: int = 0, reuse_temp: bool = False):
         self.trimx_path = trimx_path
+        self.max_workers = max_workers
+        self.use_daemon = use_daemon
+        self.stream_workers = stream_workers
+        self.reuse_temp = reuse_temp
         self.temp_dir = None
+        self.paths: Optional[SimpleNamespace] = None
+        self._resolved_for: Optional[str] = None
+        self._resolved_path: Optional[str] = None
+        self._inspect_lock = threading.Lock()
+        self._inspect_cache: "OrderedDict[Tuple[str, int, int], VideoInfo]" = OrderedDict()
+        self._daemon_proc: Optional[subprocess.Popen] = None
+        self._daemon_socket_path: Optional[str] = None
+        self._daemon_conns: List[Tuple[socket.socket, object]] = []
+        self._idle_daemon_conns: List[Tuple[socket.socket, object]] = []
+        self._daemon_lock = threading.Lock()
+        self._workers: List[subprocess.Popen] = []
+        self._idle_workers: "queue.Queue[subprocess.Popen]" = queue.Queue()
         
     def __enter__(self):
-        self.temp_dir = tempfile.mkdtemp(prefix="trimx_")
+        if (os.name == "posix" and not getattr(subprocess, "_USE_POSIX_SPAWN", False)
+                and not TrimXProcessor._fork_warning_shown):
+            TrimXProcessor._fork_warning_shown = True
+            logger.warning("posix_spawn is unavailable, trimx will be started with fork/exec")
+        self.temp_dir = self._acquire_temp_dir()
+        # Well-known locations inside the temp dir, built once per context
+        temp = Path(self.temp_dir)
+        self.paths = SimpleNamespace(
+            temp=temp,
+            clips=temp / "clips",
+            quality=temp / "quality",
+            socket=temp / "trimx.sock"
+        )
+        if self.use_daemon:
+            self._start_daemon()
+        if self.stream_workers:
+            self._start_workers()
         return self
         
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.temp_dir and os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+        self._stop_workers()
+        self._stop_daemon()
+        if self.temp_dir:
+            self._release_temp_dir()
+    
+    def _acquire_temp_dir(self) -> str:
+        """Create a work dir, or reuse a released one when reuse_temp is set
+        
+        Reused dirs live under one shared root that is removed at exit, so
+        scripts creating a processor per video skip the mkdtemp/rmtree churn.
+        """
+        if not self.reuse_temp:
+            return tempfile.mkdtemp(prefix="trimx_")
+        
+        with TrimXProcessor._temp_lock:
+            if TrimXProcessor._free_temp_dirs:
+                return TrimXProcessor._free_temp_dirs.pop()
+            if TrimXProcessor._shared_temp_root is None:
+                root = tempfile.mkdtemp(prefix="trimx_shared_")
+                atexit.register(shutil.rmtree, root, ignore_errors=True)
+                TrimXProcessor._shared_temp_root = root
+            return tempfile.mkdtemp(prefix="trimx_", dir=TrimXProcessor._shared_temp_root)
+    
+    def _release_temp_dir(self):
+        """Remove the work dir, or empty it for reuse when reuse_temp is set"""
+        if not self.reuse_temp:
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+            return
+        
+        _clear_dir(self.temp_dir)
+        with TrimXProcessor._temp_lock:
+            TrimXProcessor._free_temp_dirs.append(self.temp_dir)
+    
+    @property
+    def executable(self) -> str:
+        """trimx_path resolved against PATH
+        
+        posix_spawn is only used for executables given with a directory, and
+        resolving once also saves the PATH search on every spawn.
+        """
+        if self._resolved_for != self.trimx_path:
+            self._resolved_path = _resolve_executable(self.trimx_path)
+            self._resolved_for = self.trimx_path
+        return self._resolved_path
+    
+    def has_capability(self, name: str) -> bool:
+        """Whether trimx advertises an optional feature (see TRIMX_CAPABILITY_MARKERS)
+        
+        Backed by one cached --help probe per executable and subcommand.
+        """
+        return _trimx_has_capability(self.executable, name)
+    
+    def _start_workers(self):
+        """Start pre-warmed trimx workers that read commands from stdin
+        
+        Each worker is a 'trimx --command-stream' process taking one JSON
+        command per line, so startup cost is paid once per worker instead of
+        once per command. Without CLI support, commands spawn as usual.
+        """
+        if not self.has_capability("command-stream"):
+            logger.warning("trimx has no --command-stream mode, running one process per command")
+            return
+        
+        for _ in range(self.stream_workers):
+            worker = subprocess.Popen(
+                [self.executable, "--command-stream"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                **self.SPAWN_OPTIONS
+            )
+            self._workers.append(worker)
+            self._idle_workers.put(worker)
     
-    def run_command(self, args: List[str], capture_output: bool = True) -> subprocess.CompletedProcess:
-        """Run TrimX command with error handling"""
-        cmd = [self.trimx_path] + args
+    def _stop_workers(self):
+        """Close worker stdin so each worker exits, then reap them"""
+        for worker in self._workers:
+            try:
+                worker.stdin.close()
+            except OSError:
+                pass
+        for worker in self._workers:
+            try:
+                worker.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                worker.kill()
+                worker.wait()
+            worker.stdout.close()
+        self._workers = []
+        self._idle_workers = queue.Queue()
+    
+    def _run_worker_command(self, args: List[str], 
+                            capture_stdout: bool) -> Optional[subprocess.CompletedProcess]:
+        """Run one command on an idle worker; returns None if no worker is usable"""
+        worker = None
+        while worker is None:
+            if not any(w.poll() is None for w in self._workers):
+                return None
+            try:
+                worker = self._idle_workers.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        
+        try:
+            worker.stdin.write(json.dumps({"args": args}).encode() + b"\n")
+            worker.stdin.flush()
+            line = self._read_worker_reply(worker)
+        except OSError:
+            line = b""
+        try:
+            response = parse_json(line) if line else None
+        except ValueError:
+            response = None
+        if response is None:
+            # Dead, hung or out of sync; retire the worker and leave it out
+            # of the idle queue
+            worker.kill()
+            worker.wait()
+            return None
+        
+        self._idle_workers.put(worker)
+        return self._completed_from_response(args, response, capture_stdout)
+    
+    def _read_worker_reply(self, worker: subprocess.Popen) -> bytes:
+        """Read one reply line from a worker; b"" on EOF or after WORKER_REQUEST_TIMEOUT"""
+        if os.name == "nt":
+            # Windows selectors only support sockets; read on a helper thread.
+            # The caller kills the worker on timeout, which ends the read.
+            reply = []
+            reader = threading.Thread(target=lambda: reply.append(worker.stdout.readline()), 
+                                      daemon=True)
+            reader.start()
+            reader.join(self.WORKER_REQUEST_TIMEOUT)
+            return reply[0] if reply else b""
+        
+        fd = worker.stdout.fileno()
+        deadline = time.monotonic() + self.WORKER_REQUEST_TIMEOUT
+        chunks = []
+        with selectors.DefaultSelector() as selector:
+            selector.register(fd, selectors.EVENT_READ)
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not selector.select(remaining):
+                    return b""
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    return b""
+                chunks.append(chunk)
+                if chunk.endswith(b"\n"):
+                    return b"".join(chunks)
+    
+    def _start_daemon(self):
+        """Start a long-lived trimx daemon and connect to its Unix socket
         
+        Each in-flight command uses its own connection, taken from a pool
+        that grows on demand, so concurrent batch work is not serialized on
+        one socket. If the platform has no Unix sockets or the CLI does not
+        support the daemon subcommand, commands fall back to one process
+        per call.
+        """
+        if not hasattr(socket, "AF_UNIX"):
+            return
+        if not self.has_capability("daemon"):
+            logger.warning("trimx has no daemon mode, running one process per command")
+            return
+        
+        sock_path = str(self.paths.socket)
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=capture_output,
-                text=True,
-                check=True
+            proc = subprocess.Popen(
+                [self.executable, "daemon", "--socket", sock_path],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                **self.SPAWN_OPTIONS
             )
+        except OSError:
+            return
+        
+        deadline = time.monotonic() + self.DAEMON_STARTUP_TIMEOUT
+        while proc.poll() is None and time.monotonic() < deadline:
+            conn = self._connect_daemon(sock_path)
+            if conn is None:
+                time.sleep(0.01)
+                continue
+            self._daemon_proc = proc
+            self._daemon_socket_path = sock_path
+            self._idle_daemon_conns.append(conn)
+            return
+        
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
+        logger.warning("trimx daemon unavailable, running one process per command")
+    
+    def _connect_daemon(self, sock_path: str) -> Optional[Tuple[socket.socket, object]]:
+        """Open one daemon connection; returns None if the socket refuses it"""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(sock_path)
+        except OSError:
+            sock.close()
+            return None
+        sock.settimeout(self.DAEMON_REQUEST_TIMEOUT)
+        conn = (sock, sock.makefile("rwb"))
+        with self._daemon_lock:
+            self._daemon_conns.append(conn)
+        return conn
+    
+    def _stop_daemon(self):
+        """Shut down the trimx daemon if one is running"""
+        if self._daemon_proc is None:
+            return
+        
+        with self._daemon_lock:
+            conn = self._idle_daemon_conns[0] if self._idle_daemon_conns else None
+        if conn is not None:
+            try:
+                conn[1].write(b'{"op": "shutdown"}\n')
+                conn[1].flush()
+            except OSError:
+                pass
+        self._close_daemon_connections()
+        
+        try:
+            self._daemon_proc.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            self._daemon_proc.kill()
+            self._daemon_proc.wait()
+        self._daemon_proc = None
+    
+    def _close_daemon_connections(self):
+        """Close every daemon connection and stop routing commands to the daemon"""
+        with self._daemon_lock:
+            conns = self._daemon_conns
+            self._daemon_conns = []
+            self._idle_daemon_conns = []
+            self._daemon_socket_path = None
+        for sock, stream in conns:
+            try:
+                stream.close()
+            except OSError:
+                pass
+            sock.close()
+    
+    def _run_daemon_command(self, args: List[str], 
+                            capture_stdout: bool) -> Optional[subprocess.CompletedProcess]:
+        """Send one command to the daemon; returns None if the daemon is unusable
+        
+        The command runs on an idle pooled connection, or a new one if all
+        are busy. A reply that times out or cannot be parsed means the daemon
+        can no longer be trusted, so every connection is dropped and later
+        commands run one process per call.
+        """
+        request = json.dumps({"op": args[0], "args": args[1:]}).encode() + b"\n"
+        
+        with self._daemon_lock:
+            sock_path = self._daemon_socket_path
+            conn = self._idle_daemon_conns.pop() if self._idle_daemon_conns else None
+        if sock_path is None:
+            return None
+        if conn is None:
+            conn = self._connect_daemon(sock_path)
+            if conn is None:
+                return None
+        
+        stream = conn[1]
+        try:
+            stream.write(request)
+            stream.flush()
+            line = stream.readline()
+        except (OSError, ValueError):
+            # Includes socket timeouts, and a stream closed by another thread
+            line = b""
+        try:
+            response = parse_json(line) if line else None
+        except ValueError:
+            response = None
+        if response is None:
+            self._close_daemon_connections()
+            return None
+        
+        with self._daemon_lock:
+            if conn in self._daemon_conns:
+                self._idle_daemon_conns.append(conn)
+        return self._completed_from_response(args, response, capture_stdout)
+    
+    def _completed_from_response(self, args: List[str], response: Dict, 
+                                 capture_stdout: bool) -> subprocess.CompletedProcess:
+        """Convert a daemon or worker JSON response into a CompletedProcess"""
+        stdout = response.get("stdout", "")
+        stderr = response.get("stderr", "")
+        if not capture_stdout:
+            # Mirror a child process that inherits our stdout
+            if stdout:
+                logger.info("%s", stdout.rstrip("\n"))
+            stdout = None
+        
+        return subprocess.CompletedProcess(
+            [self.executable] + args,
+            response.get("returncode", 1),
+            stdout.encode() if stdout is not None else None,
+            stderr.encode()
+        )
+    
+    def _log_command_error(self, cmd: List[str], error: Exception):
+        """Report a failed trimx invocation"""
+        if isinstance(error, subprocess.CalledProcessError):
+            stderr = error.stderr
+            if isinstance(stderr, bytes):
+                stderr = stderr.decode(errors="replace")
+            logger.error("Error running command: %s\n"
+                         "Return code: %s\n"
+                         "Error output: %s", " ".join(cmd), error.returncode, stderr)
+        else:
+            logger.error("TrimX CLI not found at: %s\n"
+                         "Please ensure TrimX is installed and in your PATH", self.trimx_path)
+    
+    def _spawn_command(self, args: List[str], capture_stdout: bool) -> subprocess.CompletedProcess:
+        """Run trimx in a new process, returning raw bytes output
+        
+        stderr is always piped so failures can be reported. stdout is either
+        piped or inherited, so output nobody reads is never buffered.
+        """
+        cmd = [self.executable] + args
+        stdout_pipe = subprocess.PIPE if capture_stdout else None
+        if not capture_stdout:
+            _flush_logs()
+        with subprocess.Popen(cmd, stdout=stdout_pipe, stderr=subprocess.PIPE, 
+                              **self.SPAWN_OPTIONS) as proc:
+            stdout, stderr = proc.communicate()
+        return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+    
+    def _run_checked(self, args: List[str], capture_stdout: bool) -> subprocess.CompletedProcess:
+        """Run a trimx command via the daemon, a worker or a new process, raising on failure"""
+        cmd = [self.executable] + args
+        
+        try:
+            result = None
+            if self._daemon_socket_path is not None:
+                result = self._run_daemon_command(args, capture_stdout)
+            if result is None and self._workers:
+                result = self._run_worker_command(args, capture_stdout)
+            if result is None:
+                result = self._spawn_command(args, capture_stdout)
+            result.check_returncode()
             return result
-        except subprocess.CalledProcessError as e:
-            print(f"Error running command: {' '.join(cmd)}")
-            print(f"Return code: {e.returncode}")
-            print(f"Error output: {e.stderr}")
+        except (subprocess.CalledProcessError, FileNotFoundError) as e:
+            self._log_command_error(cmd, e)
             raise
-        except FileNotFoundError:
-            print(f"TrimX CLI not found at: {self.trimx_path}")
-            print("Please ensure TrimX is installed and in your PATH")
+    
+    def run_commands_parallel(self, arg_lists: List[List[str]], max_in_flight: int, 
+                              capture_output: bool = True) -> List[subprocess.CompletedProcess]:
+        """Run many trimx commands with at most max_in_flight running at once
+        
+        The output pipes of every running process are watched by one
+        selector, so a single select call services all processes that have
+        output or have exited. New commands start as soon as a slot frees up.
+        Results are returned in input order with bytes output. Failed
+        commands are logged like run_command failures but do not raise;
+        inspect returncode on each. Raises ValueError if max_in_flight is
+        less than 1.
+        """
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be at least 1, got {max_in_flight}")
+        if not capture_output:
+            _flush_logs()
+        
+        if os.name == "nt":
+            # Windows selectors only support sockets; communicate in order
+            results = []
+            for start in range(0, len(arg_lists), max_in_flight):
+                procs = [
+                    subprocess.Popen([self.executable] + args, 
+                                     stdout=subprocess.PIPE if capture_output else None, 
+                                     stderr=subprocess.PIPE)
+                    for args in arg_lists[start:start + max_in_flight]
+                ]
+                for proc in procs:
+                    stdout, stderr = proc.communicate()
+                    results.append(self._completed_parallel(proc.args, proc.returncode, 
+                                                            stdout, stderr))
+            return results
+        
+        results: List[Optional[subprocess.CompletedProcess]] = [None] * len(arg_lists)
+        pending = deque(enumerate(arg_lists))
+        running: Dict[int, Dict] = {}
+        
+        with selectors.DefaultSelector() as selector:
+            def launch(index: int, args: List[str]):
+                cmd = [self.executable] + args
+                try:
+                    proc = subprocess.Popen(
+                        cmd, stdout=subprocess.PIPE if capture_output else None, 
+                        stderr=subprocess.PIPE, **self.SPAWN_OPTIONS
+                    )
+                except FileNotFoundError as e:
+                    self._log_command_error(cmd, e)
+                    raise
+                state = {"proc": proc, "index": index, "stdout": [], "stderr": [], "open": 0}
+                for name in ("stdout", "stderr"):
+                    pipe = getattr(proc, name)
+                    if pipe is not None:
+                        selector.register(pipe, selectors.EVENT_READ, (state, name))
+                        state["open"] += 1
+                running[proc.pid] = state
+            
+            try:
+                while pending or running:
+                    while pending and len(running) < max_in_flight:
+                        launch(*pending.popleft())
+                    
+                    for key, _ in selector.select():
+                        state, name = key.data
+                        chunk = os.read(key.fd, 65536)
+                        if chunk:
+                            state[name].append(chunk)
+                            continue
+                        
+                        selector.unregister(key.fileobj)
+                        key.fileobj.close()
+                        state["open"] -= 1
+                        if state["open"] == 0:
+                            # Both pipes hit EOF, so the process has exited or is exiting
+                            proc = state["proc"]
+                            proc.wait()
+                            del running[proc.pid]
+                            results[state["index"]] = self._completed_parallel(
+                                proc.args, proc.returncode,
+                                b"".join(state["stdout"]) if capture_output else None,
+                                b"".join(state["stderr"])
+                            )
+            finally:
+                for state in running.values():
+                    state["proc"].kill()
+                    state["proc"].wait()
+        
+        return results
+    
+    def _completed_parallel(self, cmd: List[str], returncode: int, stdout: Optional[bytes], 
+                            stderr: bytes) -> subprocess.CompletedProcess:
+        """Build a run_commands_parallel result, logging it if the command failed"""
+        if returncode != 0:
+            self._log_command_error(
+                cmd, subprocess.CalledProcessError(returncode, cmd, stdout, stderr)
+            )
+        return subprocess.CompletedProcess(cmd, returncode, stdout, stderr)
+    
+    def run_command_bytes(self, args: List[str]) -> bytes:
+        """Run TrimX command and return its stdout as undecoded bytes
+        
+        Used for JSON output, which the parser reads directly from bytes.
+        """
+        return self._run_checked(args, capture_stdout=True).stdout
+    
+    def run_command(self, args: List[str], capture_output: bool = True, 
+                    text: bool = True) -> subprocess.CompletedProcess:
+        """Run TrimX command with error handling
+        
+        Commands go through the trimx daemon or a stream worker when one is
+        available, otherwise a new process is spawned.
+        """
+        result = self._run_checked(args, capture_stdout=capture_output)
+        if text:
+            if result.stdout is not None:
+                result.stdout = result.stdout.decode()
+            result.stderr = result.stderr.decode()
+        return result
+    
+    async def run_command_async(self, args: List[str], capture_output: bool = True, 
+                                text: bool = True) -> subprocess.CompletedProcess:
+        """Asynchronous variant of run_command
+        
+        Lets many trimx processes run at once from a single event loop while
+        their output is drained concurrently.
+        """
+        if self._daemon_socket_path is not None or self._workers:
+            # Daemon and worker pipes are synchronous; keep them off the event loop
+            return await asyncio.to_thread(self.run_command, args, capture_output, text)
+        
+        cmd = [self.executable] + args
+        stdout_pipe = asyncio.subprocess.PIPE if capture_output else None
+        if not capture_output:
+            _flush_logs()
+        
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd, stdout=stdout_pipe, stderr=asyncio.subprocess.PIPE, 
+                **self.SPAWN_OPTIONS
+            )
+            stdout, stderr = await proc.communicate()
+            if text:
+                stdout = stdout.decode() if stdout is not None else None
+                stderr = stderr.decode()
+            result = subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+            result.check_returncode()
+            return result
+        except (subprocess.CalledProcessError, FileNotFoundError) as e:
+            self._log_command_error(cmd, e)
             raise
     
-    def inspect_video(self, video_path: str) -> VideoInfo:
-        """Inspect video file and return structured information"""
-        print(f"Inspecting video: {video_path}")
+    def _inspect_cache_key(self, video_path: str) -> Tuple[str, int, int]:
+        st = os.stat(video_path)
+        return (os.path.abspath(video_path), st.st_mtime_ns, st.st_size)
+    
+    def _cached_inspect(self, cache_key: Tuple[str, int, int]) -> Optional[VideoInfo]:
+        with self._inspect_lock:
+            cached = self._inspect_cache.get(cache_key)
+            if cached is not None:
+                self._inspect_cache.move_to_end(cache_key)
+            return cached
+    
+    def _store_inspect(self, cache_key: Tuple[str, int, int], video_info: VideoInfo):
+        with self._inspect_lock:
+            self._inspect_cache[cache_key] = video_info
+            if len(self._inspect_cache) > self.INSPECT_CACHE_SIZE:
+                self._inspect_cache.popitem(last=False)
+    
+    def _inspect_format(self) -> str:
+        """Use the compact msgpack output when both the CLI and Python support it
         
-        # Get basic video information
-        result = self.run_command([
+        Daemon and worker replies carry stdout as a JSON string, which cannot
+        hold binary msgpack, so JSON is used whenever either may run the command.
+        """
+        if self._daemon_socket_path is not None or self._workers:
+            return "json"
+        if msgpack is not None and self.has_capability("msgpack"):
+            return "msgpack"
+        return "json"
+    
+    def _inspect_args(self, video_path: str, output_format: str) -> List[str]:
+        # Get video information and keyframes in one pass
+        return [
             "inspect", video_path,
-            "--format", "json",
-            "--show-streams"
-        ])
-        
-        data = json.loads(result.stdout)
+            "--format", output_format,
+            "--show-streams",
+            "--show-keyframes"
+        ]
+    
+    def _parse_inspect(self, video_path: str, payload: bytes, output_format: str) -> VideoInfo:
+        """Build a VideoInfo from trimx inspect output"""
+        if output_format == "msgpack":
+            data = parse_msgpack_inspect(payload)
+        else:
+            data = parse_json(payload)
         
         # Extract video stream info
         video_streams = []
         audio_streams = []
         
         for stream in data.get("streams", []):
-            if stream.get("type") == "video":
+            stream_type = stream.get("type")
+            if stream_type == "video":
                 video_streams.append(stream)
-            elif stream.get("type") == "audio":
+            elif stream_type == "audio":
                 audio_streams.append(stream)
         
         # Get primary video stream info
@@ -110,14 +929,50 @@ class TrimXProcessor:
             bit_rate=data.get("bit_rate", 0),
             file_size=data.get("file_size", 0),
             video_streams=video_streams,
-            audio_streams=audio_streams
+            audio_streams=audio_streams,
+            keyframes=data.get("keyframes", [])
         )
     
-    def extract_clip(self, video_path: str, start_time: float, end_time: float, 
-                    output_path: str, mode: str = "auto", quality_crf: Optional[int] = None) -> bool:
-        """Extract a clip from video"""
-        print(f"Extracting clip: {start_time}s to {end_time}s")
+    def inspect_video(self, video_path: str) -> VideoInfo:
+        """Inspect video file and return structured information
+        
+        Streams and keyframes are fetched in a single trimx call. Results are
+        cached per file and reused until the file's mtime or size changes.
+        """
+        cache_key = self._inspect_cache_key(video_path)
+        cached = self._cached_inspect(cache_key)
+        if cached is not None:
+            return cached
+        
+        logger.info("Inspecting video: %s", video_path)
+        output_format = self._inspect_format()
+        payload = self.run_command_bytes(self._inspect_args(video_path, output_format))
+        
+        video_info = self._parse_inspect(video_path, payload, output_format)
+        self._store_inspect(cache_key, video_info)
+        return video_info
+    
+    async def inspect_video_async(self, video_path: str) -> VideoInfo:
+        """Asynchronous variant of inspect_video sharing the same cache"""
+        cache_key = self._inspect_cache_key(video_path)
+        cached = self._cached_inspect(cache_key)
+        if cached is not None:
+            return cached
         
+        logger.info("Inspecting video: %s", video_path)
+        output_format = self._inspect_format()
+        result = await self.run_command_async(
+            self._inspect_args(video_path, output_format), text=False
+        )
+        
+        video_info = self._parse_inspect(video_path, result.stdout, output_format)
+        self._store_inspect(cache_key, video_info)
+        return video_info
+    
+    def clip_args(self, video_path: str, start_time: float, end_time: float, 
+                  output_path: str, mode: str = "auto", quality_crf: Optional[int] = None, 
+                  verify_tolerance: Optional[float] = None) -> List[str]:
+        """Build the trimx clip arguments used by extract_clip"""
         args = [
             "clip", video_path,
             "--start", str(start_time),
@@ -130,105 +985,314 @@ class TrimXProcessor:
         if quality_crf:
             args.extend(["--quality-crf", str(quality_crf)])
         
+        if verify_tolerance is not None:
+            args.extend(["--verify", "--tolerance", str(verify_tolerance)])
+        
+        return args
+    
+    def _inline_verify_passed(self, stdout: str) -> bool:
+        """Echo clip --verify output and return whether its VERIFY line reports ok"""
+        if stdout:
+            logger.info("%s", stdout.rstrip("\n"))
+        
+        for line in reversed(stdout.splitlines()):
+            if line.startswith("VERIFY:"):
+                return line.split(":", 1)[1].strip() == "ok"
+        return False
+    
+    def extract_clip(self, video_path: str, start_time: float, end_time: float, 
+                    output_path: str, mode: str = "auto", quality_crf: Optional[int] = None, 
+                    verify_inline: bool = False, tolerance: float = 0.5) -> bool:
+        """Extract a clip from video
+        
+        With verify_inline=True the clip is verified as well. If the CLI
+        supports clip --verify this happens in the same trimx process while
+        the output is still open; otherwise verify_clip is called afterwards.
+        """
+        logger.info("Extracting clip: %ss to %ss", start_time, end_time)
+        
+        inline = verify_inline and self.has_capability("verify")
+        args = self.clip_args(video_path, start_time, end_time, output_path, mode, 
+                               quality_crf, tolerance if inline else None)
         try:
-            self.run_command(args, capture_output=False)
-            return True
+            result = self.run_command(args, capture_output=inline)
         except subprocess.CalledProcessError:
             return False
+        
+        if inline:
+            return self._inline_verify_passed(result.stdout)
+        if verify_inline:
+            return self.verify_clip(output_path, start_time, end_time, tolerance)
+        return True
+    
+    async def extract_clip_async(self, video_path: str, start_time: float, end_time: float, 
+                                 output_path: str, mode: str = "auto", 
+                                 quality_crf: Optional[int] = None, 
+                                 verify_inline: bool = False, tolerance: float = 0.5) -> bool:
+        """Asynchronous variant of extract_clip"""
+        logger.info("Extracting clip: %ss to %ss", start_time, end_time)
+        
+        inline = verify_inline and self.has_capability("verify")
+        args = self.clip_args(video_path, start_time, end_time, output_path, mode, 
+                               quality_crf, tolerance if inline else None)
+        try:
+            result = await self.run_command_async(args, capture_output=inline)
+        except subprocess.CalledProcessError:
+            return False
+        
+        if inline:
+            return self._inline_verify_passed(result.stdout)
+        if verify_inline:
+            return await self.verify_clip_async(output_path, start_time, end_time, tolerance)
+        return True
+    
+    def _verify_args(self, clip_path: str, expected_start: float, expected_end: float, 
+                     tolerance: float) -> List[str]:
+        return [
+            "verify", clip_path,
+            "--expected-start", str(expected_start),
+            "--expected-end", str(expected_end),
+            "--tolerance", str(tolerance)
+        ]
     
     def verify_clip(self, clip_path: str, expected_start: float, expected_end: float, 
                    tolerance: float = 0.5) -> bool:
         """Verify extracted clip"""
-        print(f"Verifying clip: {clip_path}")
+        logger.info("Verifying clip: %s", clip_path)
         
+        args = self._verify_args(clip_path, expected_start, expected_end, tolerance)
         try:
-            self.run_command([
-                "verify", clip_path,
-                "--expected-start", str(expected_start),
-                "--expected-end", str(expected_end),
-                "--tolerance", str(tolerance)
-            ], capture_output=False)
+            self.run_command(args, capture_output=False)
             return True
         except subprocess.CalledProcessError:
             return False
     
-    def batch_extract_clips(self, video_path: str, segments: List[ClipSegment], 
-                          output_dir: str, mode: str = "auto") -> Dict[str, bool]:
-        """Extract multiple clips in batch"""
-        print(f"Batch extracting {len(segments)} clips from {video_path}")
+    async def verify_clip_async(self, clip_path: str, expected_start: float, 
+                                expected_end: float, tolerance: float = 0.5) -> bool:
+        """Asynchronous variant of verify_clip"""
+        logger.info("Verifying clip: %s", clip_path)
         
-        os.makedirs(output_dir, exist_ok=True)
-        results = {}
+        args = self._verify_args(clip_path, expected_start, expected_end, tolerance)
+        try:
+            await self.run_command_async(args, capture_output=False)
+            return True
+        except subprocess.CalledProcessError:
+            return False
+    
+    def _worker_count(self, segment_count: int, mode: str) -> int:
+        """Number of concurrent trimx processes to use for a batch"""
+        workers = self.max_workers or min(segment_count, os.cpu_count() or 1)
+        if mode == "reencode":
+            workers = min(workers, self.REENCODE_MAX_WORKERS)
+        return max(1, min(workers, segment_count))
+    
+    async def _probe_duration_async(self, clip_path: str) -> Optional[float]:
+        """Read container duration with ffprobe; None if the clip cannot be probed
         
-        for i, segment in enumerate(segments):
-            output_path = os.path.join(output_dir, f"{segment.name}.mp4")
-            
-            print(f"Processing segment {i+1}/{len(segments)}: {segment.name}")
-            
-            success = self.extract_clip(
-                video_path,
-                segment.start_time,
-                segment.end_time,
+        Raises FileNotFoundError if ffprobe is not installed.
+        """
+        proc = await asyncio.create_subprocess_exec(
+            "ffprobe", "-v", "error",
+            "-show_entries", "format=duration",
+            "-of", "csv=p=0",
+            clip_path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        
+        stdout, _ = await proc.communicate()
+        try:
+            return float(stdout) if proc.returncode == 0 else None
+        except ValueError:
+            return None
+    
+    async def fast_verify_clip_async(self, clip_path: str, expected_start: float, 
+                                     expected_end: float, tolerance: float = 0.5) -> bool:
+        """Cheap clip check: non-empty output whose duration matches the request
+        
+        Only the container header is read, instead of the full demux done by
+        trimx verify. If ffprobe is not installed this falls back to
+        verify_clip_async.
+        """
+        try:
+            if os.stat(clip_path).st_size == 0:
+                return False
+        except FileNotFoundError:
+            return False
+        
+        try:
+            duration = await self._probe_duration_async(clip_path)
+        except FileNotFoundError:
+            if not TrimXProcessor._ffprobe_warning_shown:
+                TrimXProcessor._ffprobe_warning_shown = True
+                logger.warning("ffprobe not found, fast verification falls back to trimx verify")
+            return await self.verify_clip_async(clip_path, expected_start, expected_end, tolerance)
+        if duration is None:
+            return False
+        return abs(duration - (expected_end - expected_start)) <= tolerance
+    
+    async def _process_segment_async(self, video_path: str, segment: ClipSegment, 
+                                     output_path: str, mode: str, 
+                                     verify: Union[bool, str]) -> Tuple[str, bool]:
+        """Extract and verify a single segment"""
+        strict = verify == "strict" or verify is True
+        
+        # Strict verification runs inside the clip command when the CLI allows
+        success = await self.extract_clip_async(
+            video_path,
+            segment.start_time,
+            segment.end_time,
+            output_path,
+            mode,
+            verify_inline=strict
+        )
+        
+        if not success or verify is False or strict:
+            return segment.name, success
+        
+        if mode != "copy":
+            success = await self.fast_verify_clip_async(
                 output_path,
-                mode
+                segment.start_time,
+                segment.end_time
             )
-            
-            if success:
-                # Verify the clip
-                verify_success = self.verify_clip(
-                    output_path,
-                    segment.start_time,
-                    segment.end_time
+        
+        return segment.name, success
+    
+    async def batch_extract_clips_async(self, video_path: str, segments: List[ClipSegment], 
+                                        output_dir: str, mode: str = "auto", 
+                                        verify: Union[bool, str] = "fast", 
+                                        keyframe_tolerance: Optional[float] = None
+                                        ) -> Dict[str, bool]:
+        """Extract multiple clips concurrently
+        
+        At most max_workers segments (see _worker_count) are in flight at once.
+        If keyframe_tolerance is given, all cut points are first moved to the
+        nearest keyframe within that many seconds, using one inspect call and
+        one vectorized search for the whole batch.
+        
+        verify controls how each clip is checked after extraction:
+        
+        - "fast" (default): the output must be non-empty and its duration must
+          match the segment within 0.5s. Copy-mode clips are not checked, since
+          stream copy cuts on keyframes by construction. This saves a full
+          trimx verify run per clip, but will not catch corrupt frames inside
+          a clip of the right length.
+        - "strict" or True: run trimx verify on every clip.
+        - False: no verification.
+        """
+        if verify not in (True, False, "fast", "strict"):
+            raise ValueError(f"Invalid verify option: {verify!r}")
+        
+        logger.info("Batch extracting %d clips from %s", len(segments), video_path)
+        
+        if verify == "strict" or verify is True:
+            # Probe clip --verify support once, before any concurrent work
+            self.has_capability("verify")
+        
+        os.makedirs(output_dir, exist_ok=True)
+        if not segments:
+            return {}
+        
+        if keyframe_tolerance is not None:
+            video_info = await self.inspect_video_async(video_path)
+            batch = ClipSegmentBatch.from_segments(segments)
+            segments = batch.snapped_to_keyframes(
+                video_info.keyframe_times, keyframe_tolerance
+            ).to_segments()
+        
+        output_paths = [os.path.join(output_dir, f"{segment.name}.mp4") for segment in segments]
+        in_flight = asyncio.Semaphore(self._worker_count(len(segments), mode))
+        done = 0
+        
+        async def handle(segment: ClipSegment, output_path: str) -> Tuple[str, bool]:
+            nonlocal done
+            async with in_flight:
+                result = await self._process_segment_async(
+                    video_path, segment, output_path, mode, verify
                 )
-                results[segment.name] = verify_success
-            else:
-                results[segment.name] = False
+            done += 1
+            logger.debug("Finished segment %d/%d: %s", done, len(segments), segment.name)
+            return result
         
-        return results
+        # gather keeps results in segment order regardless of completion order
+        results = await asyncio.gather(*map(handle, segments, output_paths))
+        return dict(results)
     
-    def analyze_keyframes(self, video_path: str) -> List[Dict]:
-        """Analyze keyframes in video"""
-        print(f"Analyzing keyframes: {video_path}")
+    def batch_extract_clips(self, video_path: str, segments: List[ClipSegment], 
+                          output_dir: str, mode: str = "auto", 
+                          verify: Union[bool, str] = "fast", 
+                          keyframe_tolerance: Optional[float] = None) -> Dict[str, bool]:
+        """Extract multiple clips in batch
         
-        result = self.run_command([
-            "inspect", video_path,
-            "--show-keyframes",
-            "--format", "json"
-        ])
+        Synchronous wrapper around batch_extract_clips_async, which documents
+        the options; use the async variant directly when an event loop is
+        already running.
+        """
+        return asyncio.run(self.batch_extract_clips_async(
+            video_path, segments, output_dir, mode, verify, keyframe_tolerance
+        ))
+    
+    def analyze_keyframes(self, video: Union[str, VideoInfo]) -> List[Dict]:
+        """Analyze keyframes in video
         
-        data = json.loads(result.stdout)
-        return data.get("keyframes", [])
+        Accepts either a path or a VideoInfo from a previous inspect_video call;
+        paths go through the inspect cache, so no extra trimx call is made for
+        files that have already been inspected.
+        """
+        if isinstance(video, VideoInfo):
+            return video.keyframes
+        
+        return self.inspect_video(video).keyframes
     
-    def find_optimal_cut_points(self, video_path: str, desired_start: float, 
+    def find_optimal_cut_points(self, video: Union[str, VideoInfo], desired_start: float, 
                               desired_end: float, tolerance: float = 2.0) -> Tuple[float, float]:
         """Find optimal cut points near keyframes"""
-        keyframes = self.analyze_keyframes(video_path)
+        video_info = video if isinstance(video, VideoInfo) else self.inspect_video(video)
+        times = video_info.keyframe_times
         
-        if not keyframes:
-            print("No keyframes found, using desired times")
+        if not len(times):
+            logger.info("No keyframes found, using desired times")
             return desired_start, desired_end
         
-        # Find nearest keyframes
-        start_keyframe = min(keyframes, key=lambda k: abs(k["timestamp"] - desired_start))
-        end_keyframe = min(keyframes, key=lambda k: abs(k["timestamp"] - desired_end))
+        # Find nearest keyframes by binary search over the sorted timestamps
+        start_keyframe = nearest_keyframe_time(times, desired_start)
+        end_keyframe = nearest_keyframe_time(times, desired_end)
         
         # Check if keyframes are within tolerance
-        if abs(start_keyframe["timestamp"] - desired_start) <= tolerance:
-            optimal_start = start_keyframe["timestamp"]
+        if abs(start_keyframe - desired_start) <= tolerance:
+            optimal_start = start_keyframe
         else:
             optimal_start = desired_start
             
-        if abs(end_keyframe["timestamp"] - desired_end) <= tolerance:
-            optimal_end = end_keyframe["timestamp"]
+        if abs(end_keyframe - desired_end) <= tolerance:
+            optimal_end = end_keyframe
         else:
             optimal_end = desired_end
         
-        print(f"Optimal cut points: {optimal_start:.2f}s to {optimal_end:.2f}s")
+        logger.info("Optimal cut points: %.2fs to %.2fs", optimal_start, optimal_end)
         return optimal_start, optimal_end
+    
+    def find_optimal_cut_points_batch(self, video: Union[str, VideoInfo], 
+                                      desired: Sequence[float], 
+                                      tolerance: float = 2.0) -> Sequence[float]:
+        """Snap many desired cut points to keyframes with a single inspect call"""
+        video_info = video if isinstance(video, VideoInfo) else self.inspect_video(video)
+        return snap_to_keyframes(video_info.keyframe_times, desired, tolerance)
+
+# Fast encode with a fixed one-second GOP, giving predictable keyframes
+SAMPLE_ENCODE_ARGS = [
+    "-c:v", "libx264",
+    "-preset", "ultrafast",
+    "-tune", "zerolatency",
+    "-g", "30",
+    "-x264-params", "keyint=30:min-keyint=30",
+    "-c:a", "aac",
+]
 
 def create_sample_video(output_path: str, duration: int = 30) -> bool:
     """Create a sample video for testing"""
-    print(f"Creating sample video: {output_path} ({duration}s)")
+    logger.info("Creating sample video: %s (%ss)", output_path, duration)
     
     try:
         subprocess.run([
@@ -236,8 +1300,7 @@ def create_sample_video(output_path: str, duration: int = 30) -> bool:
             "-i", f"testsrc=duration={duration}:size=640x480:rate=30",
             "-f", "lavfi",
             "-i", f"sine=frequency=1000:duration={duration}",
-            "-c:v", "libx264",
-            "-c:a", "aac",
+            *SAMPLE_ENCODE_ARGS,
             "-shortest",
             "-y", output_path
         ], check=True, capture_output=True)
@@ -245,44 +1308,91 @@ def create_sample_video(output_path: str, duration: int = 30) -> bool:
     except subprocess.CalledProcessError:
         return False
 
+# Sample videos shared by all demos and by concurrent runs of the same user;
+# kept between runs so later runs reuse them instead of encoding again
+SAMPLE_DIR = Path(tempfile.gettempdir()) / (
+    f"trimx_samples_{os.getuid()}" if hasattr(os, "getuid") else "trimx_samples"
+)
+# Part of every sample name, so samples encoded with other settings are not reused
+SAMPLE_TAG = hashlib.sha1(" ".join(SAMPLE_ENCODE_ARGS).encode()).hexdigest()[:8]
+# Anything smaller is treated as a broken sample and recreated
+SAMPLE_MIN_SIZE = 1024
+
+def _sample_ready(path: Path) -> bool:
+    return path.exists() and path.stat().st_size > SAMPLE_MIN_SIZE
+
+@functools.lru_cache(maxsize=None)
+def get_sample_video(duration: int) -> str:
+    """Return a sample video of the given duration, creating it only once
+    
+    Creation is serialized with a lock file so parallel runs sharing the
+    sample directory encode each sample only once. Raises RuntimeError if
+    the video cannot be created, or OSError if the sample directory is not
+    usable; failures are not cached.
+    """
+    name = f"sample_{duration}s_{SAMPLE_TAG}"
+    path = SAMPLE_DIR / f"{name}.mp4"
+    if _sample_ready(path):
+        return str(path)
+    
+    SAMPLE_DIR.mkdir(mode=0o700, exist_ok=True)
+    with open(SAMPLE_DIR / f"{name}.lock", "w") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        
+        # Another process may have created the sample while we waited
+        if _sample_ready(path):
+            return str(path)
+        
+        # Encode to a temporary name so a failed run never leaves a partial sample
+        partial = SAMPLE_DIR / f"{name}.{os.getpid()}.partial.mp4"
+        if not create_sample_video(str(partial), duration):
+            partial.unlink(missing_ok=True)
+            raise RuntimeError(f"Failed to create {duration}s sample video")
+        os.replace(partial, path)
+    
+    return str(path)
+
 def demo_basic_usage():
     """Demonstrate basic TrimX usage"""
-    print("=== Basic Usage Demo ===")
+    logger.info("=== Basic Usage Demo ===")
     
     with TrimXProcessor() as processor:
         # Create sample video
-        sample_video = os.path.join(processor.temp_dir, "sample.mp4")
-        if not create_sample_video(sample_video, 30):
-            print("Failed to create sample video")
+        try:
+            sample_video = get_sample_video(30)
+        except (RuntimeError, OSError):
+            logger.info("Failed to create sample video")
             return
         
         # Inspect video
         video_info = processor.inspect_video(sample_video)
-        print(f"Video duration: {video_info.duration:.2f}s")
-        print(f"Resolution: {video_info.width}x{video_info.height}")
-        print(f"Frame rate: {video_info.frame_rate:.2f} fps")
+        logger.info("Video duration: %.2fs", video_info.duration)
+        logger.info("Resolution: %dx%d", video_info.width, video_info.height)
+        logger.info("Frame rate: %.2f fps", video_info.frame_rate)
         
         # Extract a clip
-        output_path = os.path.join(processor.temp_dir, "clip.mp4")
+        output_path = str(processor.paths.temp / "clip.mp4")
         success = processor.extract_clip(sample_video, 5.0, 15.0, output_path)
         
         if success:
-            print("Clip extraction successful")
+            logger.info("Clip extraction successful")
             # Verify clip
             verify_success = processor.verify_clip(output_path, 5.0, 15.0)
-            print(f"Clip verification: {'PASSED' if verify_success else 'FAILED'}")
+            logger.info("Clip verification: %s", "PASSED" if verify_success else "FAILED")
         else:
-            print("Clip extraction failed")
+            logger.info("Clip extraction failed")
 
 def demo_batch_processing():
     """Demonstrate batch processing"""
-    print("\n=== Batch Processing Demo ===")
+    logger.info("\n=== Batch Processing Demo ===")
     
     with TrimXProcessor() as processor:
         # Create sample video
-        sample_video = os.path.join(processor.temp_dir, "sample.mp4")
-        if not create_sample_video(sample_video, 60):
-            print("Failed to create sample video")
+        try:
+            sample_video = get_sample_video(60)
+        except (RuntimeError, OSError):
+            logger.info("Failed to create sample video")
             return
         
         # Define segments to extract
@@ -294,24 +1404,25 @@ def demo_batch_processing():
         ]
         
         # Extract clips
-        output_dir = os.path.join(processor.temp_dir, "clips")
+        output_dir = str(processor.paths.clips)
         results = processor.batch_extract_clips(sample_video, segments, output_dir)
         
         # Report results
-        print("\nBatch processing results:")
+        logger.info("\nBatch processing results:")
         for name, success in results.items():
             status = "SUCCESS" if success else "FAILED"
-            print(f"  {name}: {status}")
+            logger.info("  %s: %s", name, status)
 
 def demo_quality_comparison():
     """Demonstrate quality comparison"""
-    print("\n=== Quality Comparison Demo ===")
+    logger.info("\n=== Quality Comparison Demo ===")
     
     with TrimXProcessor() as processor:
         # Create sample video
-        sample_video = os.path.join(processor.temp_dir, "sample.mp4")
-        if not create_sample_video(sample_video, 20):
-            print("Failed to create sample video")
+        try:
+            sample_video = get_sample_video(20)
+        except (RuntimeError, OSError):
+            logger.info("Failed to create sample video")
             return
         
         # Test different quality settings
@@ -322,44 +1433,64 @@ def demo_quality_comparison():
             ("slow", 15, "highest")
         ]
         
-        output_dir = os.path.join(processor.temp_dir, "quality")
-        os.makedirs(output_dir, exist_ok=True)
+        output_dir = processor.paths.quality
+        output_dir.mkdir(exist_ok=True)
         
+        # Encodes are independent, so run them side by side
         for preset, crf, description in quality_settings:
-            output_path = os.path.join(output_dir, f"quality_{preset}.mp4")
-            
-            print(f"Testing {description} quality (preset: {preset}, CRF: {crf})")
-            
-            success = processor.extract_clip(
-                sample_video, 5.0, 15.0, output_path, 
-                mode="reencode", quality_crf=crf
-            )
-            
-            if success:
-                file_size = os.path.getsize(output_path)
-                print(f"  Output size: {file_size:,} bytes")
+            logger.info("Testing %s quality (preset: %s, CRF: %s)", description, preset, crf)
+        
+        results = processor.run_commands_parallel(
+            [
+                processor.clip_args(sample_video, 5.0, 15.0, 
+                                    str(output_dir / f"quality_{preset}.mp4"), 
+                                    mode="reencode", quality_crf=crf)
+                for preset, crf, _ in quality_settings
+            ],
+            max_in_flight=TrimXProcessor.REENCODE_MAX_WORKERS
+        )
+        
+        # Output is captured per encode so concurrent runs do not interleave
+        created = []
+        for (preset, _, description), result in zip(quality_settings, results):
+            for line in result.stdout.decode(errors="replace").splitlines():
+                logger.info("  [%s] %s", description, line)
+            if result.returncode == 0:
+                created.append((description, f"quality_{preset}.mp4"))
             else:
-                print(f"  Failed to create {description} quality clip")
+                logger.info("  Failed to create %s quality clip", description)
+        
+        # Read all output sizes in a single directory pass
+        with os.scandir(output_dir) as entries:
+            sizes = {entry.name: entry.stat().st_size for entry in entries}
+        
+        for description, output_name in created:
+            size = sizes.get(output_name)
+            if size is None:
+                logger.info("  %s output missing: %s", description, output_name)
+            else:
+                logger.info("  %s output size: %s bytes", description, format(size, ","))
 
 def demo_keyframe_analysis():
     """Demonstrate keyframe analysis and optimal cutting"""
-    print("\n=== Keyframe Analysis Demo ===")
+    logger.info("\n=== Keyframe Analysis Demo ===")
     
     with TrimXProcessor() as processor:
         # Create sample video
-        sample_video = os.path.join(processor.temp_dir, "sample.mp4")
-        if not create_sample_video(sample_video, 30):
-            print("Failed to create sample video")
+        try:
+            sample_video = get_sample_video(30)
+        except (RuntimeError, OSError):
+            logger.info("Failed to create sample video")
             return
         
         # Analyze keyframes
         keyframes = processor.analyze_keyframes(sample_video)
-        print(f"Found {len(keyframes)} keyframes")
+        logger.info("Found %d keyframes", len(keyframes))
         
         if keyframes:
-            print("Keyframe timestamps:")
+            logger.info("Keyframe timestamps:")
             for i, kf in enumerate(keyframes[:10]):  # Show first 10
-                print(f"  {i+1}: {kf['timestamp']:.2f}s")
+                logger.info("  %d: %.2fs", i + 1, kf["timestamp"])
         
         # Find optimal cut points
         desired_start = 8.5
@@ -370,15 +1501,18 @@ def demo_keyframe_analysis():
         )
         
         # Extract clip with optimal cut points
-        output_path = os.path.join(processor.temp_dir, "optimal_clip.mp4")
+        output_path = str(processor.paths.temp / "optimal_clip.mp4")
         success = processor.extract_clip(
             sample_video, optimal_start, optimal_end, output_path, mode="copy"
         )
         
         if success:
-            print(f"Optimal clip extracted successfully")
-            print(f"Original desired: {desired_start:.2f}s to {desired_end:.2f}s")
-            print(f"Actual cut: {optimal_start:.2f}s to {optimal_end:.2f}s")
+            logger.info("Optimal clip extracted successfully")
+            logger.info("Original desired: %.2fs to %.2fs", desired_start, desired_end)
+            logger.info("Actual cut: %.2fs to %.2fs", optimal_start, optimal_end)
+
+# Log records buffered before a write; kept small so progress stays visible
+LOG_BUFFER_CAPACITY = 16
 
 def main():
     """Main function"""
@@ -389,32 +1523,56 @@ def main():
     
     args = parser.parse_args()
     
-    print("TrimX CLI Python Integration Examples")
-    print("====================================")
+    # Buffer log records and write them in small batches; warnings and errors
+    # flush immediately, as do records pending when trimx is started with our
+    # stdout, and run_demos flushes after each demo. The formatter
+    # belongs on the stream handler because MemoryHandler never formats.
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(
+        level=logging.INFO,
+        handlers=[logging.handlers.MemoryHandler(
+            capacity=LOG_BUFFER_CAPACITY,
+            flushLevel=logging.WARNING,
+            target=console
+        )]
+    )
+    
+    try:
+        run_demos(args)
+    finally:
+        logging.shutdown()
+
+def run_demos(args: argparse.Namespace):
+    """Check for TrimX and run the selected demos"""
+    logger.info("TrimX CLI Python Integration Examples")
+    logger.info("====================================")
     
-    # Check if TrimX is available
+    # Check if TrimX is available with the cached top-level --help probe that
+    # capability detection also uses, so no separate --version run is needed
     try:
-        subprocess.run([args.trimx_path, "--version"], check=True, capture_output=True)
-        print(f"Using TrimX CLI: {args.trimx_path}")
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print(f"Error: TrimX CLI not found at {args.trimx_path}")
-        print("Please ensure TrimX is built and installed")
+        available = bool(_trimx_help(_resolve_executable(args.trimx_path)))
+    except OSError:
+        available = False
+    if not available:
+        logger.error("Error: TrimX CLI not found at %s", args.trimx_path)
+        logger.error("Please ensure TrimX is built and installed")
         sys.exit(1)
+    logger.info("Using TrimX CLI: %s", args.trimx_path)
     
     # Run demos
-    if args.demo in ["basic", "all"]:
-        demo_basic_usage()
-    
-    if args.demo in ["batch", "all"]:
-        demo_batch_processing()
-    
-    if args.demo in ["quality", "all"]:
-        demo_quality_comparison()
-    
-    if args.demo in ["keyframes", "all"]:
-        demo_keyframe_analysis()
+    demos = [
+        ("basic", demo_basic_usage),
+        ("batch", demo_batch_processing),
+        ("quality", demo_quality_comparison),
+        ("keyframes", demo_keyframe_analysis),
+    ]
+    for name, demo in demos:
+        if args.demo in [name, "all"]:
+            demo()
+            _flush_logs()
     
-    print("\nAll demos completed successfully!")
+    logger.info("\nAll demos completed successfully!")
 
 if __name__ == "__main__":
     main()